@@ -1,18 +1,22 @@
 import asyncio
-import json
 import logging
+import multiprocessing
 import os
-import re
 import time
 import argparse
 import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import aiohttp
+import orjson
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
 from tqdm.asyncio import tqdm
 
+from parsers import parse_vehicle_data
+
 # --- CONFIGURATION ---
 TARGET_MAKES = [
     'acura', 'alfa-romeo', 'aston-martin', 'audi', 'bentley', 'bmw', 'bugatti', 'buick',
@@ -27,10 +31,25 @@ TARGET_YEARS = list(range(2000, 2026))  # Scrapes years 2000 through 2025
 RESULTS_DIR = Path("results")
 LOG_FILE = "scraper.log"
 DONE_MARKER = ".done"
+MODEL_CACHE_DIR = Path("cache/models")
+MODEL_CACHE_TTL_SECONDS = 7 * 24 * 3600 # Model lists rarely change; rediscover them after a week
+STORAGE_STATE_DIR = Path("state") # Cookies and local storage per browser fingerprint, carried over between contexts and runs
+CREATED_DIRECTORIES = set() # Result directories already created during this run
 
 # --- PERFORMANCE & ERROR HANDLING ---
 MAX_RETRIES = 5  # Number of times to retry a failed page load
-INITIAL_BACKOFF_DELAY_SECONDS = 30 # Initial delay after a failure, doubles each time
+INITIAL_BACKOFF_DELAY_SECONDS = 30 # Upper bound of the first retry delay, doubles each time
+MAX_BACKOFF_DELAY_SECONDS = 600 # Cap on the retry delay upper bound
+DEFAULT_REQUESTS_PER_SECOND = 2.0 # Global cap on requests to wheel-size.com across all workers
+CONTEXT_ROTATION_TASKS = 5 # Make/year tasks a worker handles before switching to a fresh browser context
+PAGES_PER_CONTEXT = 3 # Models of one make/year scraped concurrently by a worker, each on its own page
+
+# Subresources the parser never looks at; aborting them keeps page loads short and light
+BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"} # WebSockets bypass route() and are closed separately
+BLOCKED_URL_FRAGMENTS = (
+    "doubleclick", "googletagmanager", "googlesyndication", "google-analytics", "adservice",
+    "facebook", "hotjar"
+)
 
 # --- ANTI-DETECTION CONFIGURATION ---
 USER_AGENTS = [
@@ -56,6 +75,86 @@ VIEWPORTS = [
     {"width": 1024, "height": 768}
 ]
 
+# A scroll down and back with pauses, run inside the page in one round-trip
+HUMAN_SCROLL_SCRIPT = """
+    async ({scrollDistance, scrollPause, returnPause}) => {
+        const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+        window.scrollBy(0, scrollDistance);
+        await sleep(scrollPause);
+        window.scrollBy(0, -scrollDistance);
+        await sleep(returnPause);
+    }
+"""
+
+# The page title and the opening text of the body, enough to recognise a block or challenge page
+DETECTION_TEXT_SCRIPT = """
+    () => document.title + ' ' + (document.body ? document.body.textContent.slice(0, 2000) : '')
+"""
+
+# Serializes only the parts of a vehicle page that parse_vehicle_data reads
+VEHICLE_HTML_SCRIPT = """
+    () => ['#title-header', '.trims-list']
+        .map(selector => document.querySelector(selector))
+        .map(element => element ? element.outerHTML : '')
+        .join('')
+"""
+
+# Chromium is launched once and shared by every worker
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI',
+    '--disable-ipc-flooding-protection',
+    '--disable-hang-monitor',
+    '--disable-client-side-phishing-detection',
+    '--disable-popup-blocking',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--no-default-browser-check',
+    '--autoplay-policy=user-gesture-required',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-field-trial-config',
+    '--disable-back-forward-cache',
+    '--disable-backing-store-limit',
+    '--disable-blink-features=AutomationControlled',
+    '--excludes-switches=enable-automation',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor'
+]
+
+BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"'
+}
+
+# --- PLAIN HTTP FETCHING ---
+HTTP_TIMEOUT_SECONDS = 30
+HTTP_CONNECTION_LIMIT = 20
+HTTP_CONNECTION_LIMIT_PER_HOST = 4
+
 # --- LOGGING SETUP ---
 def setup_logging():
     """Configures logging to both a file and the console."""
@@ -68,37 +167,54 @@ def setup_logging():
         ]
     )
 
+# --- RATE LIMITING ---
+class TokenBucket:
+    """A token bucket that caps the request rate shared by all workers."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until a token is available and takes it. Waiters are served in arrival order."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 # --- ANTI-DETECTION FUNCTIONS ---
-async def setup_stealth_page(browser_instance):
+def storage_state_path(user_agent, viewport):
+    """Builds the storage state file of a fingerprint; clearance cookies only hold for the user agent that earned them."""
+    return STORAGE_STATE_DIR / f"{USER_AGENTS.index(user_agent)}_{viewport['width']}x{viewport['height']}.json"
+
+async def setup_stealth_page(browser_instance, user_agent, viewport):
     """Sets up a page with comprehensive anti-detection measures."""
+    state_path = storage_state_path(user_agent, viewport)
     context = await browser_instance.new_context(
-        user_agent=random.choice(USER_AGENTS),
-        viewport=random.choice(VIEWPORTS),
+        user_agent=user_agent,
+        viewport=viewport,
         locale="en-US",
         timezone_id="America/New_York",
         permissions=["geolocation"],
         geolocation={"latitude": 40.7128, "longitude": -74.0060},  # NYC coordinates
-        extra_http_headers={
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"'
-        }
+        extra_http_headers=BROWSER_HEADERS,
+        # Reuse this fingerprint's cookies from earlier sessions so consent banners and bot checks are not faced again
+        storage_state=state_path if state_path.exists() else None
     )
     
-    page = await context.new_page()
+    await context.route("**/*", block_unneeded_requests)
+    await context.route_web_socket("**/*", block_web_socket)
     
-    # Add comprehensive stealth scripts
-    await page.add_init_script("""
+    # Add comprehensive stealth scripts to every page opened in this context
+    await context.add_init_script("""
         // Remove webdriver property
         Object.defineProperty(navigator, 'webdriver', {
             get: () => undefined,
@@ -197,7 +313,23 @@ async def setup_stealth_page(browser_instance):
         };
     """)
     
-    return page
+    return await context.new_page()
+
+async def block_unneeded_requests(route):
+    """Aborts requests for assets and third-party trackers that the parser does not need."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_web_socket(web_socket_route):
+    """Closes a page's WebSocket before it reaches the server; the parser never needs live updates."""
+    await web_socket_route.close()
+
+def backoff_delay(attempt: int) -> float:
+    """Returns a full-jitter exponential backoff delay so failing workers don't retry in lockstep."""
+    return random.uniform(0, min(MAX_BACKOFF_DELAY_SECONDS, INITIAL_BACKOFF_DELAY_SECONDS * (2 ** attempt)))
 
 async def human_like_delay(min_delay: float = 0.5, max_delay: float = 2.0):
     """Introduces human-like delays with random variations."""
@@ -207,23 +339,20 @@ async def human_like_delay(min_delay: float = 0.5, max_delay: float = 2.0):
 async def simulate_human_behavior(page):
     """Simulates human-like behavior on the page."""
     try:
-        # Random mouse movements
-        viewport = await page.viewport_size()
+        # viewport_size is cached on the Python side, so reading it costs no round-trip
+        viewport = page.viewport_size
         if viewport:
+            # Mouse moves go through page.mouse so the page sees trusted input; scripted MouseEvents are flagged
             for _ in range(random.randint(1, 3)):
-                x = random.randint(0, viewport['width'])
-                y = random.randint(0, viewport['height'])
-                await page.mouse.move(x, y)
+                await page.mouse.move(random.randint(0, viewport['width']), random.randint(0, viewport['height']))
                 await asyncio.sleep(random.uniform(0.1, 0.3))
         
-        # Random scrolling
-        scroll_distance = random.randint(100, 500)
-        await page.evaluate(f"window.scrollBy(0, {scroll_distance})")
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        
-        # Scroll back
-        await page.evaluate(f"window.scrollBy(0, -{scroll_distance})")
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        # The scroll and its pauses need no Python in between, so they run in a single evaluate
+        await page.evaluate(HUMAN_SCROLL_SCRIPT, {
+            "scrollDistance": random.randint(100, 500),
+            "scrollPause": random.randint(200, 500),
+            "returnPause": random.randint(100, 300)
+        })
         
     except Exception as e:
         logging.debug(f"Human behavior simulation failed: {e}")
@@ -231,8 +360,9 @@ async def simulate_human_behavior(page):
 async def check_for_detection(page) -> bool:
     """Checks if the page shows signs of bot detection."""
     try:
-        # Check for common anti-bot messages
-        content = await page.content()
+        # Check for common anti-bot messages in the title and the start of the text; a challenge page is short,
+        # so this avoids serialising the whole DOM over CDP on every navigation
+        content = await page.evaluate(DETECTION_TEXT_SCRIPT)
         detection_indicators = [
             "access denied",
             "blocked",
@@ -261,118 +391,85 @@ async def check_for_detection(page) -> bool:
     except Exception:
         return False
 
-# --- UTILITY & PARSING FUNCTIONS ---
-def format_number(num_str):
-    """Formats a number string, removing .0 from whole numbers."""
-    if num_str is None: return None
-    try:
-        f = float(num_str)
-        return str(int(f)) if f.is_integer() else num_str
-    except (ValueError, TypeError): return num_str
-
-def get_clean_text(element):
-    """Extracts and cleans text from a BeautifulSoup element."""
-    if not element: return None
-    element_copy = BeautifulSoup(str(element), 'html.parser')
-    for tag in element_copy.find_all(['i', 'img', 'span'], class_=['badge', 'tire_load_index', 'd-block', 'fa-li']):
-        tag.decompose()
-    return ' '.join(element_copy.get_text(strip=True).split())
-
-def get_staggered_data(cell, is_imperial=False):
-    """Parses a table cell to extract potentially staggered (front/rear) data."""
-    target = cell
-    if is_imperial and cell.find('span', class_='imperial'):
-        target = cell.find('span', 'imperial')
-    rear_data_span = target.find('span', class_='rear-tire-data')
-    if rear_data_span:
-        rear_value = get_clean_text(rear_data_span)
-        front_target_copy = BeautifulSoup(str(target), 'html.parser')
-        front_target_copy.find('span', class_='rear-tire-data').decompose()
-        front_value = get_clean_text(front_target_copy)
-        return front_value, rear_value
-    html_string = str(target)
-    parts = re.split(r'<br\s*/?>', html_string, maxsplit=1)
-    if len(parts) == 2:
-        return get_clean_text(parts[0]), get_clean_text(parts[1])
-    return get_clean_text(target), get_clean_text(target)
-
-def parse_vehicle_data(html_content):
-    """Parses the HTML content to extract wheel and tire data for the USA market."""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    h1 = soup.find('h1', id='title-header')
-    if not h1: return []
-    make, model, year = h1.get('data-make-name'), h1.get('data-model-name'), int(h1.get('data-year'))
-    trims_list_div = soup.find('div', class_='trims-list')
-    source_html = str(trims_list_div) if trims_list_div else ""
-    results = []
-    for panel in soup.find_all('div', class_='panel', id=lambda x: x and x.startswith('trim-')):
-        if 'region-trim-usdm' not in panel.get('class', []): continue
-        trim_info = {"html_output": source_html, "make": make, "model": model, "year": year, "tires": []}
-        panel_hdr = panel.find('div', class_='panel-hdr')
-        trim_name_span = panel_hdr.find('span', class_='panel-hdr-trim-name')
-        trim_info['engine'] = trim_name_span['data-trim-name'] if trim_name_span and trim_name_span.get('data-trim-name') else get_clean_text(trim_name_span)
-        power_span = panel_hdr.find(lambda tag: 'hp' in tag.text and tag.name == 'span')
-        if power_span and (hp_match := re.search(r'(\d+)\s*hp', power_span.text)):
-            trim_info['hp'] = int(hp_match.group(1))
-        for item in panel.find_all('li', class_='element-parameter'):
-            param_name_span = item.find('span', class_='parameter-name')
-            if not param_name_span: continue
-            param_name = get_clean_text(param_name_span).lower()
-            if 'wheel tightening torque' in param_name:
-                if torque_span := item.find('span', class_='imperial'):
-                    trim_info['wheel_tightening_torque'] = get_clean_text(torque_span).lower().replace('lbf⋅ft', 'lbf ft')
-                continue
-            full_text = ' '.join(item.get_text(strip=True).split())
-            if ':' in full_text:
-                value = full_text.split(':', 1)[1].strip()
-                if 'generation' in param_name: trim_info['generation'] = value
-                elif 'production' in param_name: trim_info['production'] = value
-                elif 'center bore' in param_name: trim_info['centerbore'] = value
-                elif 'bolt pattern' in param_name: trim_info['bolt_pattern'] = value
-                elif 'wheel fasteners' in param_name: trim_info['wheel_fasterns'] = value
-                elif 'thread size' in param_name: trim_info['thread_size'] = value
-        table = panel.find('table', class_='table-ws')
-        if not table or not table.find('tbody'): continue
-        for row in table.find('tbody').find_all('tr'):
-            cells = row.find_all('td')
-            if len(cells) < 6: continue
-            tire_data = {'original_equipment': 'stock' in row.get('class', []), 'recommended_for_winter': bool(row.find('i', class_='fa-snowflake'))}
-            tire_data['front_size'], tire_data['rear_size'] = get_staggered_data(cells[0])
-            tire_data['front_rim'], tire_data['rear_rim'] = get_staggered_data(cells[1])
-            tire_data['front_offset'], tire_data['rear_offset'] = get_staggered_data(cells[2])
-            tire_data['front_backspacing'], tire_data['rear_backspacing'] = [format_number(v) for v in get_staggered_data(cells[3], is_imperial=True)]
-            tire_data['front_tire_weight'], tire_data['rear_tire_weight'] = [format_number(v) for v in get_staggered_data(cells[4], is_imperial=True)]
-            tire_data['front_max_psi'], tire_data['rear_max_psi'] = [format_number(v) for v in get_staggered_data(cells[5], is_imperial=True)]
-            trim_info['tires'].append(tire_data)
-        results.append(trim_info)
-    return results
-
-def save_vehicle_data(data, make, model, year):
-    """Saves data to a nested directory and returns True on success."""
-    make_dir_name = make.lower()
+# --- UTILITY FUNCTIONS ---
+def result_filename(make, model, year):
+    """Builds the JSON filename for a make/model/year, which is unique across the results tree."""
     model_file_name = model.lower().replace('/', '_') # Sanitize model name for filename
-    year_dir_name = str(year)
+    return f"{make.lower()}__{model_file_name}__{year}.json"
 
-    directory_path = RESULTS_DIR / make_dir_name / year_dir_name
-    directory_path.mkdir(parents=True, exist_ok=True)
+def find_existing_results():
+    """Collects the filenames of every saved result with a single walk of the results tree."""
+    return {path.name for path in RESULTS_DIR.rglob('*.json')}
+
+def ensure_directory(directory_path):
+    """Creates a directory, skipping the mkdir call for directories already created this run."""
+    if directory_path not in CREATED_DIRECTORIES:
+        directory_path.mkdir(parents=True, exist_ok=True)
+        CREATED_DIRECTORIES.add(directory_path)
+
+def save_vehicle_data(data, make, model, year, existing_files=None):
+    """Saves data to a nested directory, records it in `existing_files` and returns True on success."""
+    directory_path = RESULTS_DIR / make.lower() / str(year)
+    ensure_directory(directory_path)
     
-    filename = f"{make_dir_name}__{model_file_name}__{year_dir_name}.json"
-    filepath = directory_path / filename
+    filepath = directory_path / result_filename(make, model, year)
+    # Not a .json name, so an interrupted write is never mistaken for a saved result on resume
+    temp_path = filepath.with_name(f"{filepath.name}.tmp")
     
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialise before opening so a failed dump never touches the disk; the bytes then go out in one write
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, filepath) # Atomic, so the result file is either absent or complete
+        if existing_files is not None:
+            existing_files.add(filepath.name)
+        logging.info(f"✓ Scraped and saved {make}/{model}/{year}")
         return True
     except Exception as e:
         logging.error(f"Failed to save data for {make}/{model}/{year}: {e}")
         return False
 
+def mark_make_year_done(make, year):
+    """Writes the marker that tells later runs a make/year has been fully processed."""
+    directory_path = RESULTS_DIR / make / str(year)
+    ensure_directory(directory_path)
+    (directory_path / DONE_MARKER).touch()
+    logging.info(f"🏁 Marked {make.upper()} {year} as complete.")
+
 # --- ASYNCHRONOUS SCRAPING LOGIC ---
-async def get_models_for_make_year(page, make, year):
-    """Fetches the list of models for a given make and year using Playwright."""
+def model_cache_path(make, year):
+    """Builds the path of the cached model list for a make/year."""
+    return MODEL_CACHE_DIR / f"{make.lower()}_{year}.json"
+
+def load_cached_models(make, year):
+    """Returns the cached model list for a make/year, or None if it is missing or stale."""
+    cache_path = model_cache_path(make, year)
+    try:
+        if time.time() - cache_path.stat().st_mtime > MODEL_CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def save_cached_models(models, make, year):
+    """Caches a discovered model list for a make/year."""
+    ensure_directory(MODEL_CACHE_DIR)
+    try:
+        model_cache_path(make, year).write_bytes(orjson.dumps(models))
+    except OSError as e:
+        logging.warning(f"Could not cache models for {make} {year}: {e}")
+
+async def get_models_for_make_year(page, rate_limiter, make, year):
+    """Fetches the list of models for a given make and year, from the cache or using Playwright."""
+    if (models := load_cached_models(make, year)) is not None:
+        logging.info(f"Using {len(models)} cached models for {make.upper()} {year}.")
+        return models
+
     logging.info(f"Discovering models for {make.upper()} {year}...")
     
     # Navigate with human-like behavior
+    await rate_limiter.acquire()
     await page.goto("https://www.wheel-size.com", wait_until='domcontentloaded')
     await human_like_delay(1.0, 2.0)
     
@@ -412,24 +509,80 @@ async def get_models_for_make_year(page, make, year):
     )
     models = [text.strip().lower().replace(' ', '-') for text in model_texts]
     logging.info(f"Found {len(models)} models for {make.upper()} {year}.")
+    # An empty list is more likely a broken page than a make with no models, so it is not cached
+    if models:
+        save_cached_models(models, make, year)
     return models
 
-async def scrape_vehicle_page(page, make, model, year):
-    """Scrapes a single vehicle page with automatic retry and backoff logic."""
+def create_http_session():
+    """Creates the aiohttp session shared by all workers, with headers matching a randomly chosen browser profile."""
+    headers = {k: v for k, v in BROWSER_HEADERS.items() if k not in ('Accept-Encoding', 'Connection')}
+    headers['User-Agent'] = random.choice(USER_AGENTS)
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+    )
+
+async def fetch_vehicle_html(session, rate_limiter, url) -> Optional[str]:
+    """Fetches a vehicle page over plain HTTP. Returns None when the page needs a real browser."""
+    await rate_limiter.acquire()
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                logging.debug(f"HTTP {response.status} for {url}, falling back to the browser")
+                return None
+            html_content = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.debug(f"HTTP fetch failed for {url}: {e}")
+        return None
+    # Anti-bot challenges and JS-gated responses do not carry the server-rendered trims list
+    if 'trims-list' not in html_content:
+        return None
+    return html_content
+
+async def write_results(write_queue):
+    """Runs queued disk writes one at a time on a thread so workers never block on file I/O."""
+    loop = asyncio.get_running_loop()
+    while True:
+        write_function, write_args = await write_queue.get()
+        try:
+            await loop.run_in_executor(None, write_function, *write_args)
+        except Exception as e:
+            logging.error(f"Write failed for {write_args}: {e}", exc_info=True)
+        finally:
+            write_queue.task_done()
+
+async def store_vehicle_html(parse_pool, write_queue, existing_files, html_content, make, model, year):
+    """Parses a vehicle page in the process pool and queues any US market data it contains for saving."""
+    data = await asyncio.get_running_loop().run_in_executor(parse_pool, parse_vehicle_data, html_content)
+    if data:
+        await write_queue.put((save_vehicle_data, (data, make, model, year, existing_files)))
+    else:
+        logging.warning(f"✗ No US market data found for {make}/{model}/{year}")
+
+async def fetch_vehicle_page(page, session, rate_limiter, make, model, year):
+    """Fetches a single vehicle page with automatic retry and backoff logic, returning its HTML or None."""
     url = f"https://www.wheel-size.com/size/{make}/{model}/{year}/"
     
+    # Try the cheap plain HTTP request first and only drive the browser when it falls short
+    html_content = await fetch_vehicle_html(session, rate_limiter, url)
+    if html_content is not None:
+        return html_content
+    
     for attempt in range(MAX_RETRIES):
         try:
             # Human-like navigation
             await human_like_delay(0.5, 1.5)
-            await page.goto(url, wait_until='networkidle')
+            await rate_limiter.acquire()
+            await page.goto(url, wait_until='domcontentloaded')
             
             # Check for detection immediately after page load
             if await check_for_detection(page):
                 logging.warning(f"Detection detected on {url}, attempt {attempt + 1}")
                 if attempt + 1 == MAX_RETRIES:
                     raise Exception("Bot detection detected")
-                delay = INITIAL_BACKOFF_DELAY_SECONDS * (2 ** attempt)
+                delay = backoff_delay(attempt)
                 await asyncio.sleep(delay)
                 continue
             
@@ -437,139 +590,165 @@ async def scrape_vehicle_page(page, make, model, year):
             await simulate_human_behavior(page)
             
             await page.wait_for_selector('.trims-list .panel', timeout=20000)
-            await human_like_delay(0.5, 1.0)
             
-            html_content = await page.content()
-            data = parse_vehicle_data(html_content)
-            
-            if data:
-                if save_vehicle_data(data, make, model, year):
-                    logging.info(f"✓ Scraped and saved {make}/{model}/{year}")
-            else:
-                logging.warning(f"✗ No US market data found for {make}/{model}/{year}")
-            return # Success, exit the retry loop
+            return await page.evaluate(VEHICLE_HTML_SCRIPT) # Success, exit the retry loop
             
         except PlaywrightTimeoutError:
             if attempt + 1 == MAX_RETRIES:
                 logging.error(f"✗ Final attempt failed for {url}. Giving up.")
                 break
-            delay = INITIAL_BACKOFF_DELAY_SECONDS * (2 ** attempt)
-            logging.warning(f"Timeout for {url}. Attempt {attempt + 1}/{MAX_RETRIES}. Retrying in {delay}s...")
+            delay = backoff_delay(attempt)
+            logging.warning(f"Timeout for {url}. Attempt {attempt + 1}/{MAX_RETRIES}. Retrying in {delay:.1f}s...")
             await asyncio.sleep(delay)
         except Exception as e:
             if "detection" in str(e).lower():
                 if attempt + 1 == MAX_RETRIES:
                     logging.error(f"✗ Bot detection persisted for {url}. Giving up.")
                     break
-                delay = INITIAL_BACKOFF_DELAY_SECONDS * (2 ** attempt)
-                logging.warning(f"Bot detection for {url}. Attempt {attempt + 1}/{MAX_RETRIES}. Retrying in {delay}s...")
+                delay = backoff_delay(attempt)
+                logging.warning(f"Bot detection for {url}. Attempt {attempt + 1}/{MAX_RETRIES}. Retrying in {delay:.1f}s...")
                 await asyncio.sleep(delay)
             else:
                 logging.error(f"An unexpected error occurred for {url}: {e}", exc_info=True)
                 break # Don't retry on unexpected errors
     
     logging.error(f"✗ Failed to scrape {url} after all attempts.")
+    return None
 
-async def process_make_year(task_queue, pbar):
-    """A worker that pulls tasks from a queue and processes them."""
-    while not task_queue.empty():
-        make, year = await task_queue.get()
-        playwright_instance = None
-        browser_instance = None
-        page = None
-        
+async def save_storage_state(context, state_path):
+    """Persists a context's cookies and local storage for later contexts with the same fingerprint."""
+    try:
+        state = await context.storage_state()
+        ensure_directory(STORAGE_STATE_DIR)
+        temp_path = state_path.with_name(f"{state_path.name}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps(state))
+        os.replace(temp_path, state_path)
+    except Exception as e:
+        logging.warning(f"Could not save browser storage state: {e}")
+
+async def close_stealth_page(page):
+    """Closes a stealth page together with its browser context, ignoring errors from dead pages."""
+    try:
+        await page.context.close()
+    except:
+        pass
+
+class PagePool:
+    """The pages of one stealth browser context, each lent to one coroutine at a time."""
+
+    def __init__(self, pages, state_path):
+        self.pages = pages
+        self.state_path = state_path
+        self.idle_pages = asyncio.Queue()
+        for page in pages:
+            self.idle_pages.put_nowait(page)
+
+    @classmethod
+    async def open(cls, browser_instance, size):
+        """Creates a fresh stealth context with a random fingerprint, holding `size` pages."""
+        user_agent, viewport = random.choice(USER_AGENTS), random.choice(VIEWPORTS)
+        page = await setup_stealth_page(browser_instance, user_agent, viewport)
+        pages = [page]
         try:
-            playwright_instance = await async_playwright().start()
-            
-            # Launch browser with anti-detection settings
-            browser_instance = await playwright_instance.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--single-process',
-                    '--disable-gpu',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-features=TranslateUI',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-hang-monitor',
-                    '--disable-client-side-phishing-detection',
-                    '--disable-popup-blocking',
-                    '--disable-default-apps',
-                    '--disable-extensions',
-                    '--disable-component-extensions-with-background-pages',
-                    '--disable-background-networking',
-                    '--no-default-browser-check',
-                    '--autoplay-policy=user-gesture-required',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-field-trial-config',
-                    '--disable-back-forward-cache',
-                    '--disable-backing-store-limit',
-                    '--disable-blink-features=AutomationControlled',
-                    '--excludes-switches=enable-automation',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor'
-                ]
-            )
-            
-            page = await setup_stealth_page(browser_instance)
-            
-            # Add random delay before starting
-            await human_like_delay(1.0, 3.0)
-            
-            models = await get_models_for_make_year(page, make, year)
-            
-            for model in models:
-                make_dir_name = make.lower()
-                model_file_name = model.lower().replace('/', '_')
-                year_dir_name = str(year)
-                filename = f"{make_dir_name}__{model_file_name}__{year_dir_name}.json"
-                filepath = RESULTS_DIR / make_dir_name / year_dir_name / filename
-                
-                if filepath.exists():
-                    logging.info(f"⏭️  Skipping existing file: {filepath.relative_to(RESULTS_DIR)}")
-                    continue
-                
-                await scrape_vehicle_page(page, make, model, year)
-                
-                # Variable delay between requests
+            for _ in range(size - 1):
+                pages.append(await page.context.new_page())
+        except:
+            await close_stealth_page(page)
+            raise
+        return cls(pages, storage_state_path(user_agent, viewport))
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrows an idle page, waiting for one to be returned if all are in use."""
+        page = await self.idle_pages.get()
+        try:
+            yield page
+        finally:
+            self.idle_pages.put_nowait(page)
+
+    async def close(self, save_state=True):
+        """Optionally saves the context's storage state, then closes the context and every page in it."""
+        if save_state:
+            await save_storage_state(self.pages[0].context, self.state_path)
+        await close_stealth_page(self.pages[0])
+
+async def process_make_year(task_queue, pbar, browser_instance, session, rate_limiter, parse_pool, write_queue, existing_files):
+    """A worker that pulls tasks from a queue and processes them, rotating its browser context periodically."""
+    page_pool = None
+    tasks_on_pool = 0
+    pool_failed = False # A context that hit an error may be flagged, so its cookies are not kept
+    try:
+        while not task_queue.empty():
+            make, year = await task_queue.get()
+        
+            try:
+                # Reuse the pages across tasks, but rotate to a fresh fingerprint every few tasks
+                if page_pool is None or tasks_on_pool >= CONTEXT_ROTATION_TASKS:
+                    if page_pool:
+                        await page_pool.close(save_state=not pool_failed)
+                        page_pool = None
+                    page_pool = await PagePool.open(browser_instance, PAGES_PER_CONTEXT)
+                    tasks_on_pool = 0
+                    pool_failed = False
+                tasks_on_pool += 1
+        
+                # Add random delay before starting
                 await human_like_delay(1.0, 3.0)
+        
+                async with page_pool.acquire() as page:
+                    models = await get_models_for_make_year(page, rate_limiter, make, year)
+        
+                pending_models = []
+                for model in models:
+                    filename = result_filename(make, model, year)
+                    if filename in existing_files:
+                        logging.info(f"⏭️  Skipping existing file: {make.lower()}/{year}/{filename}")
+                        continue
+                    pending_models.append(model)
 
-            # Mark this make/year as complete
-            done_path = RESULTS_DIR / make / str(year) / DONE_MARKER
-            done_path.touch()
-            logging.info(f"🏁 Marked {make.upper()} {year} as complete.")
+                async def scrape_model(model):
+                    async with page_pool.acquire() as page:
+                        html_content = await fetch_vehicle_page(page, session, rate_limiter, make, model, year)
+                    # Parse after handing the page back so the next model's page load overlaps this parse
+                    if html_content is not None:
+                        await store_vehicle_html(parse_pool, write_queue, existing_files, html_content, make, model, year)
 
-        except PlaywrightTimeoutError:
-            logging.error(f"Critical timeout discovering models for {make} {year}. Skipping.")
-        except Exception as e:
-            logging.critical(f"A worker failed processing {make} {year}: {e}", exc_info=True)
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except:
-                    pass
-            if browser_instance:
-                try:
-                    await browser_instance.close()
-                except:
-                    pass
-            if playwright_instance:
-                try:
-                    await playwright_instance.stop()
-                except:
-                    pass
-            task_queue.task_done()
-            pbar.update(1)
+                # Overlap page loads for this make/year; the pool size bounds how many run at once
+                results = await asyncio.gather(*(scrape_model(model) for model in pending_models), return_exceptions=True)
+                failures = [result for result in results if isinstance(result, Exception)]
+                for failure in failures[1:]:
+                    logging.error(f"A model scrape failed for {make} {year}: {failure}")
+                if failures:
+                    raise failures[0]
+
+                # Mark this make/year as complete; the writer handles it after this task's results
+                await write_queue.put((mark_make_year_done, (make, year)))
+
+            except PlaywrightTimeoutError:
+                logging.error(f"Critical timeout discovering models for {make} {year}. Skipping.")
+                tasks_on_pool = CONTEXT_ROTATION_TASKS # Start the next task on a fresh context
+                pool_failed = True
+            except Exception as e:
+                logging.critical(f"A worker failed processing {make} {year}: {e}", exc_info=True)
+                tasks_on_pool = CONTEXT_ROTATION_TASKS # Start the next task on a fresh context
+                pool_failed = True
+            finally:
+                task_queue.task_done()
+                pbar.update(1)
+    finally:
+        if page_pool:
+            await page_pool.close(save_state=not pool_failed)
+
+def positive_float(value):
+    """Parses a command-line value that must be a float greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a number")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"{value!r} must be greater than zero")
+    return number
 
 async def main():
     """Main function to orchestrate the entire concurrent scraping process."""
@@ -578,10 +757,14 @@ async def main():
         '-w', '--workers', type=int, default=4,
         help='Number of concurrent browser workers to run.'
     )
+    parser.add_argument(
+        '--rps', type=positive_float, default=DEFAULT_REQUESTS_PER_SECOND,
+        help='Maximum page requests per second across all workers.'
+    )
     args = parser.parse_args()
     
     setup_logging()
-    logging.info(f"--- Starting Enhanced Anti-Detection Scraper with {args.workers} workers ---")
+    logging.info(f"--- Starting Enhanced Anti-Detection Scraper with {args.workers} workers at up to {args.rps} requests/s ---")
     
     # Generate all potential tasks
     all_tasks = [(make, year) for make in TARGET_MAKES for year in reversed(TARGET_YEARS)]
@@ -602,26 +785,50 @@ async def main():
         
     logging.info(f"Queuing {len(tasks_to_do)} tasks to be processed.")
 
+    # Index saved results once so workers can skip them without touching the filesystem
+    existing_files = find_existing_results()
+    logging.info(f"Found {len(existing_files)} previously saved results.")
+
     # Create and populate the queue
     task_queue = asyncio.Queue()
     for task in tasks_to_do:
         await task_queue.put(task)
 
-    # Start the progress bar and create worker tasks
-    pbar = tqdm(total=len(tasks_to_do), desc="Processing Make/Year combinations")
-    workers = [
-        asyncio.create_task(process_make_year(task_queue, pbar))
-        for _ in range(args.workers)
-    ]
-
-    # Wait for the queue to be fully processed
-    await task_queue.join()
-
-    # Clean up and close
-    for worker in workers:
-        worker.cancel()
-    await asyncio.gather(*workers, return_exceptions=True)
-    pbar.close()
+    # Parsing is CPU-bound, so it runs in worker processes instead of stalling the event loop.
+    # Workers are spawned, not forked: forking here would copy a process already running tqdm,
+    # resolver and writer threads and holding the Playwright driver pipes.
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")) as parse_pool:
+        # One HTTP session for all workers keeps connections warm and enforces the connector limits globally
+        async with async_playwright() as playwright_instance, create_http_session() as session:
+            # Launch one browser with anti-detection settings; each worker gets its own context
+            browser_instance = await playwright_instance.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+            # Start the writer, the progress bar and worker tasks sharing one request budget
+            write_queue = asyncio.Queue()
+            writer = asyncio.create_task(write_results(write_queue))
+            rate_limiter = TokenBucket(args.rps)
+            pbar = tqdm(total=len(tasks_to_do), desc="Processing Make/Year combinations", mininterval=0.5)
+            workers = [
+                asyncio.create_task(process_make_year(task_queue, pbar, browser_instance, session, rate_limiter, parse_pool, write_queue, existing_files))
+                for _ in range(args.workers)
+            ]
+
+            try:
+                # Wait for the queue to be fully processed
+                await task_queue.join()
+                # Workers leave their loop once the queue is empty; let them close their contexts and save state
+                await asyncio.gather(*workers, return_exceptions=True)
+            finally:
+                # Clean up and close; cancelling only reaches workers still running after an error or interrupt
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                # Flush results still waiting to be written
+                await write_queue.join()
+                writer.cancel()
+                await asyncio.gather(writer, return_exceptions=True)
+                pbar.close()
+                await browser_instance.close()
 
     logging.info("--- Enhanced Anti-Detection Scraper Finished All Queued Tasks ---")
 
@@ -0,0 +1,169 @@
+import re
+import sys
+
+import lxml.html
+from lxml import etree
+
+# --- PARSING FUNCTIONS ---
+def has_class(class_name):
+    """Builds an XPath predicate matching elements whose class list contains `class_name`."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+# XPath expressions are compiled once at import and evaluated by libxml2.
+TITLE_HEADER_XP = etree.XPath('//h1[@id="title-header"]')
+TRIMS_LIST_XP = etree.XPath(f'//div[{has_class("trims-list")}]')
+USDM_PANELS_XP = etree.XPath(f'.//div[{has_class("panel")} and {has_class("region-trim-usdm")} and starts-with(@id, "trim-")]')
+PANEL_HEADER_XP = etree.XPath(f'.//div[{has_class("panel-hdr")}]')
+TRIM_NAME_XP = etree.XPath(f'.//span[{has_class("panel-hdr-trim-name")}]')
+POWER_SPAN_XP = etree.XPath('.//span[contains(., "hp")]')
+PARAMETER_ITEMS_XP = etree.XPath(f'.//li[{has_class("element-parameter")}]')
+IMPERIAL_SPAN_XP = etree.XPath(f'.//span[{has_class("imperial")}]')
+TIRE_TABLE_BODY_XP = etree.XPath(f'.//table[{has_class("table-ws")}]//tbody')
+TABLE_ROWS_XP = etree.XPath('.//tr')
+ROW_CELLS_XP = etree.XPath('.//td')
+SNOWFLAKE_ICON_XP = etree.XPath(f'.//i[{has_class("fa-snowflake")}]')
+
+# Decorative tags (badges, load indexes, icons) whose text must not leak into cell values.
+NOISE_TAGS = ('i', 'img', 'span')
+NOISE_CLASSES = frozenset(['badge', 'tire_load_index', 'd-block', 'fa-li'])
+HP_RE = re.compile(r'(\d+)\s*hp')
+TORQUE_UNIT_TABLE = str.maketrans({'⋅': ' '}) # 'lbf⋅ft' -> 'lbf ft'
+USDM_PANEL_CLASS = 'region-trim-usdm'
+# One parser per process: libxml2's C parser, tolerant of broken markup and not capped on document size
+HTML_PARSER = lxml.html.HTMLParser(huge_tree=True, recover=True, remove_comments=True, remove_pis=True)
+# Parameter name fragments and the trim_info keys their values are stored under, checked in order
+PARAMETER_FIELDS = {
+    'generation': 'generation',
+    'production': 'production',
+    'center bore': 'centerbore',
+    'bolt pattern': 'bolt_pattern',
+    'wheel fasteners': 'wheel_fasterns',
+    'thread size': 'thread_size',
+}
+
+def format_number(num_str):
+    """Formats a number string, removing .0 from whole numbers."""
+    if num_str is None: return None
+    try:
+        f = float(num_str)
+        return sys.intern(str(int(f))) if f.is_integer() else num_str # Interned like the cell text it replaces
+    except (ValueError, TypeError): return num_str
+
+def first_match(xpath, node):
+    """Returns the first node matched by a compiled XPath, or None."""
+    matches = xpath(node)
+    return matches[0] if matches else None
+
+def is_noise_tag(element):
+    """Checks whether an element is decoration that should be left out of extracted text."""
+    return element.tag in NOISE_TAGS and not NOISE_CLASSES.isdisjoint(element.get('class', '').split())
+
+def iter_clean_strings(element):
+    """Yields the text under an element, skipping noise tags."""
+    if element.text:
+        yield element.text
+    for child in element:
+        # Comments are stripped at parse time; any other non-element node has a callable tag and only its tail is kept
+        if isinstance(child.tag, str) and not is_noise_tag(child):
+            yield from iter_clean_strings(child)
+        if child.tail:
+            yield child.tail
+
+def join_clean_strings(strings):
+    """Joins stripped text nodes and collapses the result's whitespace."""
+    return ' '.join(''.join(s.strip() for s in strings).split())
+
+def get_clean_text(element):
+    """Extracts and cleans text from an lxml element."""
+    if element is None: return None
+    return join_clean_strings(iter_clean_strings(element))
+
+def collect_cell_strings(cell):
+    """Collects a cell's clean text in a single walk, split around its first <br> and its rear-tire-data span.
+
+    Returns the text nodes before the <br>, those after it (None without a <br>) and
+    those of the rear-tire-data span (None without one).
+    """
+    before_br, after_br = [], []
+    rear_parts = None
+    seen_br = False
+    def walk(node):
+        nonlocal seen_br, rear_parts
+        if node.text:
+            (after_br if seen_br else before_br).append(node.text)
+        for child in node:
+            if child.tag == 'br':
+                seen_br = True
+            elif isinstance(child.tag, str) and not is_noise_tag(child):
+                if rear_parts is None and child.tag == 'span' and 'rear-tire-data' in child.get('class', '').split():
+                    rear_parts = list(iter_clean_strings(child))
+                else:
+                    walk(child)
+            if child.tail:
+                (after_br if seen_br else before_br).append(child.tail)
+    walk(cell)
+    return before_br, (after_br if seen_br else None), rear_parts
+
+def get_staggered_data(cell, is_imperial=False):
+    """Parses a table cell to extract potentially staggered (front/rear) data."""
+    target = cell
+    if is_imperial and (imperial_span := first_match(IMPERIAL_SPAN_XP, cell)) is not None:
+        target = imperial_span
+    before_br, after_br, rear_parts = collect_cell_strings(target)
+    # An explicit rear-tire-data span wins; everything else in the cell is the front value
+    if rear_parts is not None:
+        # Cell values repeat across rows and trims, so each one is interned to share a single string
+        return sys.intern(join_clean_strings(before_br + (after_br or []))), sys.intern(join_clean_strings(rear_parts))
+    front_value = sys.intern(join_clean_strings(before_br))
+    if after_br is None:
+        return front_value, front_value
+    return front_value, sys.intern(join_clean_strings(after_br))
+
+def parse_vehicle_data(html_content):
+    """Parses the HTML content to extract wheel and tire data for the USA market."""
+    # Pages without a single USDM trim have nothing to extract, so skip parsing them altogether
+    if USDM_PANEL_CLASS not in html_content: return []
+    tree = lxml.html.document_fromstring(html_content, parser=HTML_PARSER)
+    trims_list_div = first_match(TRIMS_LIST_XP, tree)
+    if trims_list_div is None: return []
+    # Only USDM trim panels are ever selected; when the class appeared elsewhere on the page, stop before any other lookup
+    usdm_panels = USDM_PANELS_XP(trims_list_div)
+    if not usdm_panels: return []
+    h1 = first_match(TITLE_HEADER_XP, tree)
+    if h1 is None: return []
+    make, model, year = h1.get('data-make-name'), h1.get('data-model-name'), int(h1.get('data-year'))
+    results = []
+    for panel in usdm_panels:
+        trim_info = {"make": make, "model": model, "year": year, "tires": []}
+        panel_hdr = first_match(PANEL_HEADER_XP, panel)
+        trim_name_span = first_match(TRIM_NAME_XP, panel_hdr)
+        trim_info['engine'] = trim_name_span.get('data-trim-name') if trim_name_span is not None and trim_name_span.get('data-trim-name') else get_clean_text(trim_name_span)
+        power_span = first_match(POWER_SPAN_XP, panel_hdr)
+        if power_span is not None and (hp_match := HP_RE.search(power_span.text_content())):
+            trim_info['hp'] = int(hp_match.group(1))
+        for item in PARAMETER_ITEMS_XP(panel):
+            # One pass over the item's text yields both the name and the value on either side of the first ':'
+            param_name, separator, value = join_clean_strings(item.itertext()).partition(':')
+            param_name = param_name.lower()
+            if 'wheel tightening torque' in param_name:
+                if (torque_span := first_match(IMPERIAL_SPAN_XP, item)) is not None:
+                    trim_info['wheel_tightening_torque'] = sys.intern(get_clean_text(torque_span).lower().translate(TORQUE_UNIT_TABLE))
+                continue
+            field = next((field for fragment, field in PARAMETER_FIELDS.items() if fragment in param_name), None)
+            if field is not None and separator:
+                trim_info[field] = sys.intern(value.strip())
+        table_body = first_match(TIRE_TABLE_BODY_XP, panel)
+        if table_body is None: continue
+        for row in TABLE_ROWS_XP(table_body):
+            cells = ROW_CELLS_XP(row)
+            if len(cells) < 6: continue
+            tire_data = {'original_equipment': 'stock' in row.get('class', '').split(), 'recommended_for_winter': bool(SNOWFLAKE_ICON_XP(row))}
+            tire_data['front_size'], tire_data['rear_size'] = get_staggered_data(cells[0])
+            tire_data['front_rim'], tire_data['rear_rim'] = get_staggered_data(cells[1])
+            tire_data['front_offset'], tire_data['rear_offset'] = get_staggered_data(cells[2])
+            tire_data['front_backspacing'], tire_data['rear_backspacing'] = [format_number(v) for v in get_staggered_data(cells[3], is_imperial=True)]
+            tire_data['front_tire_weight'], tire_data['rear_tire_weight'] = [format_number(v) for v in get_staggered_data(cells[4], is_imperial=True)]
+            tire_data['front_max_psi'], tire_data['rear_max_psi'] = [format_number(v) for v in get_staggered_data(cells[5], is_imperial=True)]
+            trim_info['tires'].append(tire_data)
+        results.append(trim_info)
+    return results